@@ -1,19 +1,22 @@
 #!/usr/bin/env python3
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import signal
 import sys
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
 from utils.config_loader import get_config
 from utils.contract_resolver import get_contract_resolver
-from utils.fetcher_job import FetcherJob, FetcherError
+from utils.fetcher_job import FetcherJob, FetcherError, RateLimiter, TWS_HOST, TWS_PORT
+from utils.storage import StorageHelper
 
-# Global variables for shutdown handling
-shutdown_requested = False
-current_job: Optional[FetcherJob] = None
+if TYPE_CHECKING:
+    from ib_async import IB
 
 def setup_logging() -> logging.Logger:
     """Set up logging configuration."""
@@ -25,51 +28,84 @@ def setup_logging() -> logging.Logger:
     timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     log_file = log_dir / f'fetcher_{timestamp}.log'
     
+    # Log records are queued and written by a background listener thread so
+    # file and console I/O never blocks the event loop
+    log_queue: queue.Queue = queue.Queue(-1)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queue handler must pass messages through unformatted; the listener's
+    # handlers apply the real format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[queue_handler]
     )
     
     return logging.getLogger('fetcher')
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals."""
-    global shutdown_requested, current_job
-    if not shutdown_requested:
-        logger = logging.getLogger('fetcher')
-        logger.info(f"Received signal {signum}. Initiating graceful shutdown...")
-        shutdown_requested = True
-        if current_job:
-            current_job.cancel()
+def install_signal_handlers(task: asyncio.Task, logger: logging.Logger) -> None:
+    """
+    Cancel the given task on SIGINT/SIGTERM.
+    
+    Cancellation is delivered straight into whatever the task is awaiting,
+    including in-flight historical data requests.
+    
+    Args:
+        task: The task to cancel
+        logger: Logger instance
+    """
+    loop = asyncio.get_running_loop()
+    
+    def handle_signal(sig: signal.Signals) -> None:
+        logger.info(f"Received signal {sig.name}. Cancelling in-flight fetches...")
+        task.cancel()
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, handle_signal, sig)
+        except NotImplementedError:
+            # Not available on Windows; Ctrl+C still raises KeyboardInterrupt
+            pass
 
-async def run_symbol(symbol: str, logger: logging.Logger) -> Dict[str, Any]:
+async def run_symbol(symbol: str, logger: logging.Logger, ib: 'IB',
+                     storage: Optional[StorageHelper] = None,
+                     existing_dates: Optional[List[date]] = None,
+                     rate_limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
     """
     Run fetcher job for a single symbol.
     
     Args:
         symbol: The symbol to fetch
         logger: Logger instance
+        ib: Shared IB connection
+        storage: Shared storage helper
+        existing_dates: Dates already on disk for the symbol
+        rate_limiter: Rate limiter shared by all symbols on the IB connection
     
     Returns:
         Dictionary containing job results
     """
-    global current_job
     try:
         logger.info(f"Starting fetch job for {symbol}")
-        job = FetcherJob(symbol)
-        current_job = job
+        job = FetcherJob(symbol, ib=ib, storage=storage, existing_dates=existing_dates,
+                         rate_limiter=rate_limiter)
         result = await job.run()
-        current_job = None
         
         if result['status'] == 'error':
             logger.error(f"Error fetching {symbol}: {result.get('error', 'Unknown error')}")
-        elif result['status'] == 'cancelled':
-            logger.info(f"Fetch job for {symbol} was cancelled")
         else:
             logger.info(
                 f"Completed {symbol}: {result['days_fetched']} days fetched, "
@@ -84,8 +120,6 @@ async def run_symbol(symbol: str, logger: logging.Logger) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Unexpected error for {symbol}: {str(e)}")
         return {'status': 'error', 'error': str(e)}
-    finally:
-        current_job = None
 
 async def main():
     """Main entry point."""
@@ -94,9 +128,11 @@ async def main():
     logger.info("Starting IB Historical Data Fetcher")
     
     # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    install_signal_handlers(asyncio.current_task(), logger)
     
+    from ib_async import IB
+    
+    ib = IB()
     try:
         # Load configuration
         config = get_config()
@@ -109,19 +145,48 @@ async def main():
             logger.error(f"Configuration validation failed: {str(e)}")
             return
         
+        # Scan every symbol's directory up front, in parallel and off the event loop
+        storage = StorageHelper()
+        existing_dates = await asyncio.to_thread(storage.get_existing_dates_bulk, config.symbols)
+        
+        # Open a single IB connection shared by all symbols
+        try:
+            await ib.connectAsync(TWS_HOST, TWS_PORT, clientId=1)
+            logger.info("Connected to IB Gateway/TWS")
+        except Exception as e:
+            logger.error(f"Failed to connect to IB Gateway/TWS: {str(e)}")
+            return
+        
         # Initialize results tracking
         results: Dict[str, Dict[str, Any]] = {}
         total_days_fetched = 0
         total_days_failed = 0
         total_days = 0
         
-        # Process each symbol
-        for symbol in config.symbols:
-            if shutdown_requested:
-                logger.info("Shutdown requested. Stopping after current symbol...")
-                break
-            
-            result = await run_symbol(symbol, logger)
+        # Process symbols concurrently, bounded by the configured limit
+        semaphore = asyncio.Semaphore(config.concurrency)
+        
+        # Requests from every symbol go over the same connection, so they share one limit
+        rate_limiter = RateLimiter(config.rate_limit.seconds_between_requests)
+        
+        async def bounded(symbol: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await run_symbol(symbol, logger, ib, storage, existing_dates.get(symbol), rate_limiter)
+        
+        tasks = [asyncio.ensure_future(bounded(symbol)) for symbol in config.symbols]
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            logger.info("Shutdown requested. Outstanding fetches cancelled")
+        
+        for symbol, task in zip(config.symbols, tasks):
+            if task.cancelled():
+                result = {'status': 'cancelled'}
+            elif task.exception() is not None:
+                logger.error(f"Unexpected error for {symbol}: {str(task.exception())}")
+                result = {'status': 'error', 'error': str(task.exception())}
+            else:
+                result = task.result()
             results[symbol] = result
             
             if result['status'] == 'complete':
@@ -149,10 +214,16 @@ async def main():
             else:
                 logger.info(f"{symbol}: Failed - {result.get('error', 'Unknown error')}")
         
+    except asyncio.CancelledError:
+        logger.info("Shutdown requested. Exiting...")
+        return
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         return
     finally:
+        if ib.isConnected():
+            ib.disconnect()
+            logger.info("Disconnected from IB Gateway/TWS")
         logger.info("IB Historical Data Fetcher finished")
 
 if __name__ == '__main__':
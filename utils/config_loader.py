@@ -1,7 +1,8 @@
 import os
-import yaml
-from dataclasses import dataclass
-from typing import List, Dict, Any
+import hashlib
+import json
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional
 import logging
 from pathlib import Path
 
@@ -19,6 +20,7 @@ class Config:
     rate_limit: RateLimitConfig
     calendar: CalendarConfig
     log_level: str
+    concurrency: int
 
 class ConfigError(Exception):
     """Base exception for configuration errors."""
@@ -95,6 +97,70 @@ def validate_log_level(config: Dict[str, Any]) -> str:
     
     return log_level.upper()
 
+def validate_concurrency(config: Dict[str, Any]) -> int:
+    """Validate concurrency configuration."""
+    if 'concurrency' not in config:
+        return 1  # Default to fetching one symbol at a time
+    
+    concurrency = config['concurrency']
+    if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency <= 0:
+        raise ConfigValidationError("'concurrency' must be a positive integer")
+    
+    return concurrency
+
+def _get_yaml_loader() -> type:
+    """Get the libyaml-backed safe loader if available, else the pure-Python one."""
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
+
+def _get_cache_path(config_path: str) -> str:
+    """Get the path of the parsed-config JSON cache for a config file."""
+    directory, filename = os.path.split(config_path)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, f'.{stem}.cache.json')
+
+def _load_cached_config(cache_path: str, source_hash: str) -> Optional[Config]:
+    """
+    Load configuration from the JSON cache if it was built from the same YAML content.
+    
+    Args:
+        cache_path: Path to the JSON cache
+        source_hash: SHA-256 hex digest of the current YAML file contents
+    
+    Returns:
+        Config object, or None if the cache is missing, stale or unreadable.
+    """
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        # File timestamps can be restored to older values (cp -p, git checkout,
+        # rsync -t), so only the content decides whether the cache is current
+        if cached['source_sha256'] != source_hash:
+            return None
+        cached = cached['config']
+        return Config(
+            symbols=cached['symbols'],
+            rate_limit=RateLimitConfig(**cached['rate_limit']),
+            calendar=CalendarConfig(**cached['calendar']),
+            log_level=cached['log_level'],
+            concurrency=cached['concurrency']
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _write_cached_config(config: Config, cache_path: str, source_hash: str) -> None:
+    """Atomically write the validated configuration and its source hash to the JSON cache."""
+    tmp_path = f'{cache_path}.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({'source_sha256': source_hash, 'config': asdict(config)}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"Could not write config cache: {str(e)}")
+
 def load_config(config_path: str = None) -> Config:
     """
     Load and validate configuration from YAML file.
@@ -105,6 +171,9 @@ def load_config(config_path: str = None) -> Config:
     Returns:
         Config object containing validated configuration.
     
+    A JSON copy of the validated configuration is cached next to the YAML
+    file and reused while the YAML file's contents are unchanged.
+    
     Raises:
         ConfigFileError: If config file cannot be read or parsed
         ConfigValidationError: If config validation fails
@@ -113,10 +182,23 @@ def load_config(config_path: str = None) -> Config:
         config_path = os.path.join('config', 'config.yaml')
     
     try:
-        with open(config_path, 'r') as f:
-            config_dict = yaml.safe_load(f)
+        with open(config_path, 'rb') as f:
+            raw = f.read()
     except FileNotFoundError:
         raise ConfigFileError(f"Config file not found: {config_path}")
+    
+    # Hashing the small YAML file is far cheaper than parsing it
+    source_hash = hashlib.sha256(raw).hexdigest()
+    cache_path = _get_cache_path(config_path)
+    cached_config = _load_cached_config(cache_path, source_hash)
+    if cached_config is not None:
+        return cached_config
+    
+    # yaml is only imported on a cache miss, so a cache hit never pays for it
+    import yaml
+    
+    try:
+        config_dict = yaml.load(raw, Loader=_get_yaml_loader())
     except yaml.YAMLError as e:
         raise ConfigFileError(f"Error parsing config file: {str(e)}")
     
@@ -125,15 +207,20 @@ def load_config(config_path: str = None) -> Config:
         rate_limit = validate_rate_limit(config_dict)
         calendar = validate_calendar(config_dict)
         log_level = validate_log_level(config_dict)
+        concurrency = validate_concurrency(config_dict)
         
-        return Config(
+        config = Config(
             symbols=symbols,
             rate_limit=rate_limit,
             calendar=calendar,
-            log_level=log_level
+            log_level=log_level,
+            concurrency=concurrency
         )
     except ConfigValidationError as e:
         raise ConfigValidationError(f"Configuration validation failed: {str(e)}")
+    
+    _write_cached_config(config, cache_path, source_hash)
+    return config
 
 def get_config() -> Config:
     """
@@ -1,9 +1,8 @@
 import csv
 import os
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional
 from pathlib import Path
-import pandas as pd
 
 @dataclass
 class ContractSpec:
@@ -41,6 +40,7 @@ class ContractResolver:
             contracts_path = os.path.join('config', 'contracts.csv')
         self.contracts_path = contracts_path
         self._contracts: Dict[str, ContractSpec] = {}
+        self._contract_keys: FrozenSet[str] = frozenset()
         self._load_contracts()
     
     def _load_contracts(self) -> None:
@@ -52,23 +52,27 @@ class ContractResolver:
             ContractValidationError: If contract validation fails
         """
         try:
-            df = pd.read_csv(self.contracts_path)
+            # utf-8-sig strips the byte-order mark Excel writes at the start of CSV files
+            with open(self.contracts_path, 'r', newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                if reader.fieldnames is None:
+                    raise ContractFileError("Contracts file is empty")
+                
+                # Validate required fields
+                missing_fields = self.REQUIRED_FIELDS - set(reader.fieldnames)
+                if missing_fields:
+                    raise ContractValidationError(
+                        f"Missing required fields in contracts file: {', '.join(missing_fields)}"
+                    )
+                
+                rows = list(reader)
         except FileNotFoundError:
             raise ContractFileError(f"Contracts file not found: {self.contracts_path}")
-        except pd.errors.EmptyDataError:
-            raise ContractFileError("Contracts file is empty")
-        except pd.errors.ParserError as e:
+        except csv.Error as e:
             raise ContractFileError(f"Error parsing contracts file: {str(e)}")
         
-        # Validate required fields
-        missing_fields = self.REQUIRED_FIELDS - set(df.columns)
-        if missing_fields:
-            raise ContractValidationError(
-                f"Missing required fields in contracts file: {', '.join(missing_fields)}"
-            )
-        
         # Validate and store contracts
-        for _, row in df.iterrows():
+        for row in rows:
             try:
                 self._validate_contract_row(row)
                 contract = ContractSpec(
@@ -77,18 +81,20 @@ class ContractResolver:
                     exchange=row['exchange'].strip(),
                     currency=row['currency'].strip()
                 )
-                self._contracts[contract.symbol] = contract
+                self._contracts[contract.symbol.upper()] = contract
             except Exception as e:
                 raise ContractValidationError(
-                    f"Invalid contract specification for symbol {row.get('symbol', 'UNKNOWN')}: {str(e)}"
+                    f"Invalid contract specification for symbol {row.get('symbol') or 'UNKNOWN'}: {str(e)}"
                 )
+        
+        self._contract_keys = frozenset(self._contracts)
     
-    def _validate_contract_row(self, row: pd.Series) -> None:
+    def _validate_contract_row(self, row: Dict[str, str]) -> None:
         """
         Validate a single contract row.
         
         Args:
-            row: Pandas Series containing contract data
+            row: Dictionary containing contract data
         
         Raises:
             ContractValidationError: If validation fails
@@ -145,7 +151,7 @@ class ContractResolver:
         Raises:
             ContractValidationError: If any symbol is missing a contract specification
         """
-        missing_symbols = set(symbol.upper() for symbol in symbols) - set(self._contracts.keys())
+        missing_symbols = frozenset(map(str.upper, symbols)) - self._contract_keys
         if missing_symbols:
             raise ContractValidationError(
                 f"Missing contract specifications for symbols: {', '.join(missing_symbols)}"
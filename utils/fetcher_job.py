@@ -1,22 +1,100 @@
 import asyncio
+import bisect
+import functools
 import logging
+import math
 from datetime import datetime, date, timedelta
-from typing import List, Optional, Dict, Any
-import pandas as pd
-import pandas_market_calendars as mcal
-from ib_async import IB, Contract, BarData
-from ib_async.client import Client
-from ib_async.contract import Stock
-import pytz
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, List, Optional, Dict, Any
 
 from .config_loader import get_config, Config
 from .contract_resolver import get_contract_resolver, ContractSpec
 from .storage import StorageHelper, StorageError
 
+# Heavy third-party modules are imported where they are first used so that
+# importing this module stays cheap.
+if TYPE_CHECKING:
+    import pandas as pd
+    import pytz
+    from ib_async import IB
+
+# TWS/IB Gateway connection settings
+TWS_HOST = '127.0.0.1'
+TWS_PORT = 7497
+
+# Cached schedules start here, so every symbol's range is a slice of the same schedule
+SCHEDULE_START = date(1990, 1, 1)
+
+def _schedule(exchange: str, start_date: date, end_date: date) -> tuple:
+    """
+    Get the trading days of an exchange calendar.
+    
+    Args:
+        exchange: pandas_market_calendars exchange name
+        start_date: Start date
+        end_date: End date
+    
+    Returns:
+        Tuple of trading days
+    """
+    import pandas_market_calendars as mcal
+    
+    calendar = mcal.get_calendar(exchange)
+    schedule = calendar.schedule(start_date=start_date, end_date=end_date)
+    return tuple(schedule.index.date)
+
+@functools.lru_cache(maxsize=8)
+def _cached_schedule(exchange: str, end_date: date) -> tuple:
+    """
+    Get the trading days of an exchange calendar from SCHEDULE_START, cached across jobs.
+    
+    The cache is keyed only on the exchange and end date; each symbol's start
+    date is applied by slicing, so symbols with different histories share an entry.
+    
+    Args:
+        exchange: pandas_market_calendars exchange name
+        end_date: End date
+    
+    Returns:
+        Tuple of trading days
+    """
+    return _schedule(exchange, SCHEDULE_START, end_date)
+
 class FetcherError(Exception):
     """Base exception for fetcher-related errors."""
     pass
 
+class RateLimiter:
+    """Spaces historical data requests made over a shared IB connection."""
+    
+    def __init__(self, seconds_between_requests: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            seconds_between_requests: Minimum time between two requests, across
+                every job that shares this limiter
+        """
+        self.seconds_between_requests = seconds_between_requests
+        self._lock = asyncio.Lock()
+        self._last_request: Optional[float] = None
+    
+    async def acquire(self, wait: Optional[Callable[[int], Awaitable[None]]] = None) -> None:
+        """
+        Wait until the next request may be sent, then claim the slot.
+        
+        Args:
+            wait: Coroutine function called with the number of seconds to wait,
+                e.g. to log a countdown. Defaults to asyncio.sleep.
+        """
+        wait = wait or asyncio.sleep
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            if self._last_request is not None:
+                remaining = self._last_request + self.seconds_between_requests - loop.time()
+                if remaining > 0:
+                    await wait(math.ceil(remaining))
+            self._last_request = loop.time()
+
 class FetcherJob:
     """Handles fetching historical data for a single symbol."""
     
@@ -31,17 +109,45 @@ class FetcherJob:
         'GLOBEX': 'US/Central', # For futures
     }
     
-    def __init__(self, symbol: str):
+    # Maximum trading days per historical data request (~390 1-min RTH bars per day,
+    # IB caps a single request at roughly 2000 bars)
+    MAX_DAYS_PER_REQUEST = 5
+    
+    # IB errors that will fail again on retry. Everything else, e.g. pacing
+    # violations (162, 165, 420) or data farm connectivity (2104-2108), is retried.
+    PERMANENT_ERROR_CODES = frozenset({200, 354})
+    PERMANENT_ERROR_MESSAGES = ('no security definition', 'query returned no data')
+    
+    def __init__(self, symbol: str, ib: Optional['IB'] = None, client_id: int = 1,
+                 storage: Optional[StorageHelper] = None,
+                 existing_dates: Optional[Iterable[date]] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the fetcher job.
         
         Args:
             symbol: The symbol to fetch data for
+            ib: Shared, already connected IB client. If None, the job opens
+                and closes its own connection.
+            client_id: IB API client ID used when the job owns its connection
+            storage: Shared storage helper. If None, the job creates its own.
+            existing_dates: Dates already on disk, e.g. from a startup scan of
+                all symbols. If None, they are read from storage on first use.
+            rate_limiter: Rate limiter shared by all jobs on the same IB client.
+                If None, the job spaces only its own requests.
         """
+        import pytz
+        from ib_async import IB
+        from ib_async.contract import Stock
+        
         self.symbol = symbol.upper()
+        self.client_id = client_id
         self.config = get_config()
         self.contract_resolver = get_contract_resolver()
-        self.storage = StorageHelper()
+        self.storage = storage if storage is not None else StorageHelper()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(
+            self.config.rate_limit.seconds_between_requests
+        )
         
         # Get contract specification
         contract_spec = self.contract_resolver.get_contract(self.symbol)
@@ -49,51 +155,71 @@ class FetcherJob:
             raise FetcherError(f"No contract specification found for {self.symbol}")
         self.contract_spec = contract_spec
         
-        # Initialize calendar
-        self.calendar = mcal.get_calendar(self.config.calendar.exchange)
+        # Build the IB contract once and reuse it for every request
+        self._contract = Stock(
+            symbol=self.symbol,
+            exchange=self.contract_spec.exchange,
+            currency=self.contract_spec.currency
+        )
         
         # Initialize IB client
-        self.ib = IB()
-        self.client = None
+        self._owns_connection = ib is None
+        self.ib = ib if ib is not None else IB()
         
         # Initialize logging
         self.logger = logging.getLogger(f"FetcherJob.{self.symbol}")
         
-        # Initialize cancellation flag
-        self._cancelled = False
+        # Dates already on disk, loaded on first use unless provided
+        self._existing_dates: Optional[set] = set(existing_dates) if existing_dates is not None else None
+        
+        # Last IB error reported for this job's contract, as (code, message)
+        self._last_error: Optional[tuple] = None
         
         # Set timezone based on exchange
-        self.timezone = pytz.timezone(self.EXCHANGE_TIMEZONES.get(
+        self._tz_name = self.EXCHANGE_TIMEZONES.get(
             self.contract_spec.exchange,
             'US/Eastern'  # Default to US/Eastern if exchange not found
-        ))
-    
-    def cancel(self) -> None:
-        """Cancel the current fetch operation."""
-        self._cancelled = True
-        self.logger.info("Fetch operation cancelled")
+        )
+        self.timezone = pytz.timezone(self._tz_name)
     
     async def connect(self) -> None:
-        """Connect to IB Gateway/TWS."""
+        """Connect to IB Gateway/TWS unless a shared connection was provided."""
+        if not self._owns_connection:
+            return
         try:
-            self.client = await self.ib.connectAsync('127.0.0.1', 7497, clientId=1)
+            await self.ib.connectAsync(TWS_HOST, TWS_PORT, clientId=self.client_id)
             self.logger.info("Connected to IB Gateway/TWS")
         except Exception as e:
             raise FetcherError(f"Failed to connect to IB Gateway/TWS: {str(e)}")
     
-    async def disconnect(self) -> None:
-        """Disconnect from IB Gateway/TWS."""
-        if self.client:
-            await self.ib.disconnect()
+    def disconnect(self) -> None:
+        """Disconnect from IB Gateway/TWS if the job owns the connection."""
+        if self._owns_connection and self.ib.isConnected():
+            self.ib.disconnect()
             self.logger.info("Disconnected from IB Gateway/TWS")
     
-    def _create_contract(self) -> Contract:
-        """Create IB contract from specification."""
-        return Stock(
-            symbol=self.symbol,
-            exchange=self.contract_spec.exchange,
-            currency=self.contract_spec.currency
-        )
+    def _on_ib_error(self, reqId: int, errorCode: int, errorString: str, contract: Any) -> None:
+        """Record IB errors reported for this job's contract."""
+        if contract is not None and getattr(contract, 'symbol', None) == self.symbol:
+            self._last_error = (errorCode, errorString)
+    
+    def _is_transient(self, code: Optional[int], message: str) -> bool:
+        """
+        Decide whether a failed request is worth retrying.
+        
+        Args:
+            code: IB error code, if known
+            message: Error message
+        
+        Returns:
+            False for errors that will fail again on retry, True otherwise
+        """
+        if code in self.PERMANENT_ERROR_CODES:
+            return False
+        lowered = message.lower()
+        if any(text in lowered for text in self.PERMANENT_ERROR_MESSAGES):
+            return False
+        return True
     
     def _get_trading_days(self, start_date: date, end_date: date) -> List[date]:
         """
@@ -106,8 +232,12 @@ class FetcherJob:
         Returns:
             List of trading days
         """
-        schedule = self.calendar.schedule(start_date=start_date, end_date=end_date)
-        return schedule.index.date.tolist()
+        exchange = self.config.calendar.exchange
+        if start_date < SCHEDULE_START:
+            return list(_schedule(exchange, start_date, end_date))
+        
+        trading_days = _cached_schedule(exchange, end_date)
+        return list(trading_days[bisect.bisect_left(trading_days, start_date):])
     
     def _get_missing_dates(self, trading_days: List[date]) -> List[date]:
         """
@@ -119,10 +249,42 @@ class FetcherJob:
         Returns:
             List of dates that need to be fetched
         """
-        existing_dates = set(self.storage.get_existing_dates(self.symbol))
+        if self._existing_dates is None:
+            self._existing_dates = set(self.storage.get_existing_dates(self.symbol))
+        
+        existing_dates = self._existing_dates
+        if not existing_dates:
+            # First run for this symbol: everything is missing
+            return list(trading_days)
+        if len(existing_dates) >= len(trading_days):
+            # Mostly-complete history: let set difference do the work in C
+            return sorted(set(trading_days) - existing_dates)
         return [d for d in trading_days if d not in existing_dates]
     
-    def _get_exchange_timezone(self) -> pytz.timezone:
+    def _chunk_contiguous(self, missing_dates: List[date], trading_days: List[date],
+                          max_days: int = MAX_DAYS_PER_REQUEST) -> List[List[date]]:
+        """
+        Group missing dates into runs of adjacent trading days.
+        
+        Args:
+            missing_dates: Sorted list of dates that need to be fetched
+            trading_days: Sorted list of all trading days in the range
+            max_days: Maximum number of days per group
+        
+        Returns:
+            List of groups, each a list of consecutive trading days
+        """
+        positions = {d: i for i, d in enumerate(trading_days)}
+        chunks: List[List[date]] = []
+        for fetch_date in missing_dates:
+            if (chunks and len(chunks[-1]) < max_days
+                    and positions[fetch_date] == positions[chunks[-1][-1]] + 1):
+                chunks[-1].append(fetch_date)
+            else:
+                chunks.append([fetch_date])
+        return chunks
+    
+    def _get_exchange_timezone(self) -> 'pytz.BaseTzInfo':
         """Get the timezone for the contract's exchange."""
         return self.timezone
     
@@ -137,9 +299,12 @@ class FetcherJob:
             Formatted datetime string in exchange timezone with timezone specification
         """
         # Convert to exchange timezone
-        exchange_dt = dt.astimezone(self._get_exchange_timezone())
+        d = dt.astimezone(self.timezone)
         # Format as yyyymmdd HH:mm:ss with timezone
-        return f"{exchange_dt.strftime('%Y%m%d %H:%M:%S')} {exchange_dt.tzinfo.zone}"
+        return (
+            f"{d.year:04d}{d.month:02d}{d.day:02d} "
+            f"{d.hour:02d}:{d.minute:02d}:{d.second:02d} {self._tz_name}"
+        )
     
     async def _wait_with_countdown(self, seconds: int) -> None:
         """
@@ -148,79 +313,144 @@ class FetcherJob:
         Args:
             seconds: Number of seconds to wait
         """
-        for i in range(seconds, 0, -1):
-            if i <= 5:  # Only show last 5 seconds to avoid log spam
-                self.logger.info(f"{i}...")
+        # Sleep through everything but the last 5 seconds in one go to avoid log spam
+        if seconds > 5:
+            await asyncio.sleep(seconds - 5)
+            start = 5
+        else:
+            start = seconds
+        
+        for i in range(start, 0, -1):
+            self.logger.info(f"{i}...")
             await asyncio.sleep(1)
     
-    async def _fetch_bars(self, fetch_date: date, retries: int = 3) -> Optional[pd.DataFrame]:
+    def _split_by_day(self, bars: list) -> Dict[date, list]:
         """
-        Fetch bars for a single day with retry logic.
+        Partition IB bars by trading date in the exchange timezone.
         
         Args:
-            fetch_date: Date to fetch
-            retries: Number of retry attempts
+            bars: List of BarData returned by IB
         
         Returns:
-            DataFrame containing the bars, or None if fetch failed
+            Dictionary mapping each date to its bars
+        """
+        by_day: Dict[date, list] = {}
+        for bar in bars:
+            # Bars are requested with formatDate=2, so bar.date is always UTC-aware
+            bar_date = bar.date.astimezone(self.timezone).date()
+            by_day.setdefault(bar_date, []).append(bar)
+        return by_day
+    
+    def _bars_to_frame(self, bars: list) -> Optional['pd.DataFrame']:
         """
-        if self._cancelled:
+        Convert IB bars to a validated DataFrame column by column.
+        
+        The OHLCV columns are validated as one numpy block first, so no DataFrame
+        is built for invalid data.
+        
+        Args:
+            bars: List of BarData returned by IB
+        
+        Returns:
+            DataFrame with timestamp and OHLCV columns, or None if validation fails
+        """
+        import numpy as np
+        import pandas as pd
+        
+        # Timestamps are UTC-aware datetimes as returned by IB
+        timestamps = [bar.date for bar in bars]
+        # OHLCV goes into one contiguous (rows, 5) float64 block so it is validated
+        # in a single pass. Volume is float64 too, so NaN and fractional values
+        # fail validation instead of raising or being truncated.
+        ohlcv = np.fromiter(
+            ((bar.open, bar.high, bar.low, bar.close, bar.volume) for bar in bars),
+            dtype=np.dtype((np.float64, 5)),
+            count=len(bars)
+        )
+        
+        if not self.storage.validate_arrays(timestamps, ohlcv):
             return None
-            
-        contract = self._create_contract()
+        
+        return pd.DataFrame({
+            'timestamp': pd.DatetimeIndex(timestamps).tz_convert(self._tz_name),
+            'open': ohlcv[:, 0],
+            'high': ohlcv[:, 1],
+            'low': ohlcv[:, 2],
+            'close': ohlcv[:, 3],
+            'volume': ohlcv[:, 4].astype(np.int64),
+        }, copy=False)
+    
+    async def _fetch_bars(self, chunk: List[date], retries: int = 3) -> Dict[date, 'pd.DataFrame']:
+        """
+        Fetch bars for a run of consecutive trading days in one request, with retry logic.
+        
+        Args:
+            chunk: Consecutive trading days to fetch
+            retries: Number of retry attempts
+        
+        Returns:
+            Dictionary mapping each successfully fetched and validated date to its bars
+        """
+        contract = self._contract
+        label = str(chunk[0]) if len(chunk) == 1 else f"{chunk[0]} to {chunk[-1]}"
+        
+        # Format the end-of-day request time once for all attempts
+        end_dt = datetime.combine(chunk[-1], datetime.max.time())
+        end_dt_str = self._format_datetime(self._get_exchange_timezone().localize(end_dt))
         
         for attempt in range(retries):
-            if self._cancelled:
-                return None
-                
             try:
                 # Wait for rate limit with countdown
-                if attempt > 0:
-                    await self._wait_with_countdown(self.config.rate_limit.seconds_between_requests)
-                
-                # Create end datetime in exchange timezone
-                end_dt = datetime.combine(fetch_date, datetime.max.time())
-                end_dt = self._get_exchange_timezone().localize(end_dt)
+                await self.rate_limiter.acquire(self._wait_with_countdown)
                 
                 # Log the request with timezone
-                self.logger.info(f"Requesting bars for {self.symbol} with end time {self._format_datetime(end_dt)}")
+                self.logger.info(f"Requesting bars for {self.symbol} with end time {end_dt_str}")
+                self._last_error = None
                 
-                # Request bars with timezone-aware datetime
+                # Request bars for the whole chunk with timezone-aware datetime
                 bars = await self.ib.reqHistoricalDataAsync(
                     contract,
-                    endDateTime=self._format_datetime(end_dt),
-                    durationStr='1 D',
+                    endDateTime=end_dt_str,
+                    durationStr=f'{len(chunk)} D',
                     barSizeSetting='1 min',
                     whatToShow='TRADES',
-                    useRTH=True
+                    useRTH=True,
+                    formatDate=2  # UTC-aware bar times, independent of the TWS login timezone
                 )
                 
                 if not bars:
-                    self.logger.warning(f"No bars returned for {fetch_date}")
+                    self.logger.warning(f"No bars returned for {label}")
+                    if self._last_error and not self._is_transient(*self._last_error):
+                        self.logger.error(
+                            f"Not retrying {label}: IB error {self._last_error[0]}: {self._last_error[1]}"
+                        )
+                        return {}
                     continue
                 
-                # Convert to DataFrame
-                df = pd.DataFrame([{
-                    'timestamp': bar.date,
-                    'open': bar.open,
-                    'high': bar.high,
-                    'low': bar.low,
-                    'close': bar.close,
-                    'volume': bar.volume
-                } for bar in bars])
+                # Split into per-day validated DataFrames
+                bars_by_day = self._split_by_day(bars)
+                frames: Dict[date, 'pd.DataFrame'] = {}
+                for fetch_date in chunk:
+                    day_bars = bars_by_day.get(fetch_date)
+                    if not day_bars:
+                        self.logger.warning(f"No bars returned for {fetch_date}")
+                        continue
+                    
+                    df = self._bars_to_frame(day_bars)
+                    if df is not None:
+                        frames[fetch_date] = df
+                    else:
+                        self.logger.warning(f"Invalid bars for {fetch_date}")
                 
-                # Validate bars
-                if self.storage.validate_bars(df):
-                    return df
-                else:
-                    self.logger.warning(f"Invalid bars for {fetch_date}")
+                if frames:
+                    return frames
                 
             except Exception as e:
-                self.logger.error(f"Error fetching bars for {fetch_date} (attempt {attempt + 1}/{retries}): {str(e)}")
-                if attempt == retries - 1:
-                    return None
+                self.logger.error(f"Error fetching bars for {label} (attempt {attempt + 1}/{retries}): {str(e)}")
+                if attempt == retries - 1 or not self._is_transient(getattr(e, 'code', None), str(e)):
+                    return {}
         
-        return None
+        return {}
     
     async def _find_earliest_available_date(self) -> Optional[date]:
         """
@@ -229,10 +459,11 @@ class FetcherJob:
         Returns:
             The earliest available date, or None if not found
         """
-        contract = self._create_contract()
+        contract = self._contract
         
         try:
             # Request 20 years of data to find the earliest available date
+            await self.rate_limiter.acquire(self._wait_with_countdown)
             bars = await self.ib.reqHistoricalDataAsync(
                 contract,
                 endDateTime=self._format_datetime(datetime.now(self._get_exchange_timezone())),
@@ -269,6 +500,7 @@ class FetcherJob:
         if not end_date:
             end_date = date.today()
             
+        self.ib.errorEvent += self._on_ib_error
         try:
             await self.connect()
             
@@ -279,46 +511,51 @@ class FetcherJob:
                     self.logger.error(f"Could not determine start date for {self.symbol}")
                     return {'status': 'error', 'error': 'Could not determine start date'}
             
+            # Clear out temporary files left by an earlier crashed run
+            removed = self.storage.remove_stale_tmp_files(self.symbol)
+            if removed:
+                self.logger.info(f"Removed {removed} stale temporary files for {self.symbol}")
+            
             # Get trading days
             trading_days = self._get_trading_days(start_date, end_date)
             missing_dates = self._get_missing_dates(trading_days)
             
             if not missing_dates:
                 self.logger.info(f"No missing dates for {self.symbol}")
-                return {'status': 'complete', 'days_fetched': 0, 'total_days': len(trading_days)}
+                return {'status': 'complete', 'days_fetched': 0, 'days_failed': 0, 'total_days': len(trading_days)}
             
-            # Fetch missing dates
+            # Fetch missing dates, several consecutive days per request
+            chunks = self._chunk_contiguous(missing_dates, trading_days)
             days_fetched = 0
             days_failed = 0
             
-            for i, fetch_date in enumerate(missing_dates, 1):
-                if self._cancelled:
-                    self.logger.info("Fetch operation cancelled")
-                    break
-                    
-                self.logger.info(f"Fetching {self.symbol} for {fetch_date} ({i}/{len(missing_dates)})")
+            for i, chunk in enumerate(chunks, 1):
+                self.logger.info(
+                    f"Fetching {self.symbol} for {chunk[0]} to {chunk[-1]} "
+                    f"({len(chunk)} days, request {i}/{len(chunks)})"
+                )
                 
-                # Wait for rate limit with countdown
-                if i > 1:
-                    await self._wait_with_countdown(self.config.rate_limit.seconds_between_requests)
+                # Fetch the chunk and write its days to one session file, a row group per day
+                frames = await self._fetch_bars(chunk)
+                days_failed += len(chunk) - len(frames)
+                if not frames:
+                    continue
+                try:
+                    # Frames from _fetch_bars were already validated
+                    self.storage.save_bars_bulk(self.symbol, frames, validated=True)
+                except StorageError as e:
+                    self.logger.error(f"Failed to save bars: {str(e)}")
+                    days_failed += len(frames)
+                    continue
                 
-                # Fetch and save bars
-                bars = await self._fetch_bars(fetch_date)
-                if bars is not None:
-                    try:
-                        self.storage.save_bars(self.symbol, fetch_date, bars)
-                        days_fetched += 1
-                        self.logger.info(f"✅ {self.symbol} {fetch_date}: {len(bars)} bars")
-                    except StorageError as e:
-                        self.logger.error(f"Failed to save bars: {str(e)}")
-                        days_failed += 1
-                else:
-                    if self._cancelled:
-                        break
-                    days_failed += 1
+                # The session file is now synced and in place, so the days count as fetched
+                for fetch_date, bars in frames.items():
+                    self._existing_dates.add(fetch_date)
+                    days_fetched += 1
+                    self.logger.info(f"✅ {self.symbol} {fetch_date}: {len(bars)} bars")
             
             return {
-                'status': 'complete' if not self._cancelled else 'cancelled',
+                'status': 'complete',
                 'days_fetched': days_fetched,
                 'days_failed': days_failed,
                 'total_days': len(trading_days)
@@ -329,4 +566,5 @@ class FetcherJob:
             return {'status': 'error', 'error': str(e)}
         
         finally:
-            await self.disconnect() 
\ No newline at end of file
+            self.ib.errorEvent -= self._on_ib_error
+            self.disconnect() 
\ No newline at end of file
@@ -1,15 +1,244 @@
+import functools
+import logging
 import os
-import pandas as pd
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from itertools import chain
 from pathlib import Path
-from typing import Optional, List
-from datetime import datetime, date
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Sequence, List, Dict, Set, Tuple
+from datetime import date
+
+# pandas, pyarrow.csv and pyarrow.dataset are imported where they are first used
+# so that importing this module (and fetcher_job with it) stays cheap.
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Columns every bars DataFrame must have
+_REQUIRED_COLS = frozenset(['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+_NUMERIC_COLS = ('open', 'high', 'low', 'close', 'volume')
+
+# On-disk dtypes for bars. Prices stay float64: float32 cannot hold cents
+# above ~$131k and rounds ordinary prices (150.37 reads back as 150.369995).
+# Repeated prices are dictionary-encoded by Parquet, which keeps files small.
+_DTYPES = {'open': 'float64', 'high': 'float64', 'low': 'float64', 'close': 'float64', 'volume': 'int64'}
+
+def _validate_block_numpy(block: np.ndarray) -> bool:
+    """Check a (rows, OHLCV) block with whole-buffer numpy reductions."""
+    if not np.isfinite(block).all() or (block < 0).any():
+        return False
+    if (block[:, 4] != np.floor(block[:, 4])).any():
+        return False
+    return bool((block[:, 1] >= block[:, 2]).all())
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to whole-buffer numpy reductions
+    _validate_block = _validate_block_numpy
+else:
+    @njit(cache=True)
+    def _validate_block(block):
+        """Check a (rows, OHLCV) block in a single fused pass, stopping at the first bad row."""
+        for i in range(block.shape[0]):
+            o = block[i, 0]
+            h = block[i, 1]
+            lo = block[i, 2]
+            c = block[i, 3]
+            v = block[i, 4]
+            if not (np.isfinite(o) and np.isfinite(h) and np.isfinite(lo)
+                    and np.isfinite(c) and np.isfinite(v)):
+                return False
+            if o < 0 or h < 0 or lo < 0 or c < 0 or v < 0:
+                return False
+            if v != np.floor(v):
+                return False
+            if h < lo:
+                return False
+        return True
+
+def _validate_timestamps(timestamps) -> bool:
+    """Check that timestamps have no missing values and strictly increase."""
+    import pandas as pd
+    
+    try:
+        index = pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True))
+    except (TypeError, ValueError):
+        return False
+    return not index.hasnans and index.is_monotonic_increasing and index.is_unique
+
+def _read_parquet_mapped(path: Path) -> pa.Table:
+    """Read a Parquet file through a memory map."""
+    return pq.read_table(path, memory_map=True)
+
+def _read_csv_mapped(path: Path) -> pa.Table:
+    """Parse a CSV file straight from a memory map."""
+    import pyarrow.csv as pacsv
+    
+    with pa.memory_map(str(path), 'r') as source:
+        return pacsv.read_csv(source)
+
+def _read_session_days(path: Path) -> List[Tuple[date, int]]:
+    """List the (date, row group) pairs in a session file using only its footer statistics."""
+    metadata = pq.read_metadata(path)
+    column = metadata.schema.to_arrow_schema().get_field_index('date')
+    if column < 0:
+        return []
+    
+    days = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        # Each row group holds exactly one day
+        if stats is not None and stats.has_min_max and stats.min == stats.max:
+            days.append((stats.min, i))
+    return days
+
+def _read_row_groups(path: Path, row_groups: List[int]) -> pa.Table:
+    """Read some days' row groups from a session file through a memory map."""
+    table = pq.ParquetFile(path, memory_map=True).read_row_groups(row_groups)
+    return table.drop_columns(['date'])
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry to disk so a rename inside it survives power loss."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on Windows; renames there are already durable
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 class StorageError(Exception):
     """Base exception for storage-related errors."""
     pass
 
+class SymbolWriter:
+    """
+    Writes a batch of a symbol's days into one Parquet session file, one row group per day.
+    
+    The file is written under a hidden temporary name and only synced and moved
+    into place by close(), so a day is on disk for readers exactly when close()
+    has returned. Leaving the context with an exception discards the file.
+    """
+    
+    def __init__(self, storage: 'StorageHelper', symbol: str):
+        """
+        Initialize the writer.
+        
+        Args:
+            storage: The storage helper the file belongs to
+            symbol: The symbol
+        """
+        self.symbol = symbol
+        self._storage = storage
+        self._path = storage._get_symbol_dir(symbol) / (
+            f"{storage.SESSION_PREFIX}{time.time_ns()}{storage.FILE_SUFFIX}"
+        )
+        self._tmp_path = self._path.with_name(f".{self._path.name}{storage.TMP_SUFFIX}")
+        self._file = None
+        self._writer: Optional[pq.ParquetWriter] = None
+    
+    def add_day(self, date: date, bars: 'pd.DataFrame', validated: bool = False) -> None:
+        """
+        Append one day's bars as a new row group.
+        
+        Args:
+            date: The date of the bars
+            bars: DataFrame containing the bars data
+            validated: True if the caller already validated the bars
+        
+        Raises:
+            StorageError: If writing fails
+        """
+        try:
+            table = self._storage._to_table(bars, validated)
+            table = table.append_column('date', pa.array([date] * table.num_rows, type=pa.date32()))
+            
+            if self._writer is None:
+                self._file = open(self._tmp_path, 'wb', buffering=self._storage.WRITE_BUFFER_SIZE)
+                self._writer = pq.ParquetWriter(self._file, table.schema, compression='snappy')
+            self._writer.write_table(table, row_group_size=max(table.num_rows, 1))
+            
+        except Exception as e:
+            raise StorageError(f"Failed to save bars for {self.symbol} on {date}: {str(e)}")
+    
+    def close(self) -> None:
+        """
+        Write the file footer, sync the file to disk and move it into place.
+        
+        Raises:
+            StorageError: If closing fails; the temporary file is removed
+        """
+        if self._writer is None:
+            return
+        
+        try:
+            self._writer.close()
+            self._writer = None
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+            os.replace(self._tmp_path, self._path)
+            _fsync_dir(self._path.parent)
+        except Exception as e:
+            self.abort()
+            raise StorageError(f"Failed to close session file for {self.symbol}: {str(e)}")
+        finally:
+            self._storage._invalidate_dates_cache(self.symbol)
+    
+    def abort(self) -> None:
+        """Discard everything written so far and remove the temporary file."""
+        try:
+            if self._writer is not None:
+                self._writer.close()
+            if self._file is not None:
+                self._file.close()
+        except Exception:
+            pass
+        self._writer = None
+        self._file = None
+        try:
+            self._tmp_path.unlink()
+        except OSError:
+            pass
+    
+    def __enter__(self) -> 'SymbolWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Commit only on success; on error, discard the file and let the original exception propagate
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
 class StorageHelper:
-    """Helper class for managing CSV storage operations."""
+    """Helper class for managing Parquet storage operations."""
+    
+    # Bars are written as Parquet; CSV files from earlier versions are still read
+    FILE_SUFFIX = '.parquet'
+    LEGACY_SUFFIX = '.csv'
+    
+    # Bulk writes go to session files holding many days, one row group each
+    SESSION_PREFIX = 'bars-'
+    
+    # Files are written as .NAME.tmp and renamed when complete. Temporary files
+    # older than this were left behind by a crash and are removed.
+    TMP_SUFFIX = '.tmp'
+    STALE_TMP_SECONDS = 600
+    
+    # Directory mtimes only advance in filesystem-sized ticks (up to 2 s on FAT/SMB).
+    # A listing is only trusted once its directory's mtime is at least this much
+    # older than the scan, so a change in the same tick cannot go unnoticed.
+    MTIME_GRANULARITY_NS = 2_000_000_000
+    
+    # Bar files are small, so a 1 MiB buffer lets each one reach disk in a single write
+    WRITE_BUFFER_SIZE = 1 << 20
     
     def __init__(self, base_dir: str = 'data'):
         """
@@ -20,6 +249,18 @@ class StorageHelper:
         """
         self.base_dir = Path(base_dir)
         self._ensure_base_dir()
+        
+        # Symbol directory paths, so each save or read reuses one Path per symbol
+        self._symbol_dirs: Dict[str, Path] = {}
+        
+        # Directories known to exist, so repeated saves skip the mkdir call
+        self._created_dirs: Set[Path] = {self.base_dir}
+        
+        # Existing dates per symbol as (directory mtime, scan start time, dates)
+        self._dates_cache: Dict[str, Tuple[int, int, List[date]]] = {}
+        
+        # Session file and row group holding each day, refreshed with the dates cache
+        self._session_days: Dict[str, Dict[date, Tuple[Path, int]]] = {}
     
     def _ensure_base_dir(self) -> None:
         """Ensure the base directory exists."""
@@ -27,11 +268,40 @@ class StorageHelper:
     
     def _get_symbol_dir(self, symbol: str) -> Path:
         """Get the directory path for a symbol."""
-        return self.base_dir / symbol.upper()
+        symbol_dir = self._symbol_dirs.get(symbol)
+        if symbol_dir is None:
+            symbol_dir = self.base_dir / symbol.upper()
+            self._symbol_dirs[symbol] = symbol_dir
+        return symbol_dir
     
     def _ensure_symbol_dir(self, symbol: str) -> None:
         """Ensure the symbol directory exists."""
-        self._get_symbol_dir(symbol).mkdir(parents=True, exist_ok=True)
+        symbol_dir = self._get_symbol_dir(symbol)
+        if symbol_dir in self._created_dirs:
+            return
+        symbol_dir.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(symbol_dir)
+    
+    def _get_file_path(self, symbol: str, date: date, suffix: str = FILE_SUFFIX) -> Path:
+        """Get the file path for a symbol's bars on a date."""
+        return self._get_symbol_dir(symbol) / f"{date.isoformat()}{suffix}"
+    
+    def _to_table(self, bars: 'pd.DataFrame', validated: bool = False) -> pa.Table:
+        """
+        Convert bars to an Arrow table with the on-disk dtypes.
+        
+        Args:
+            bars: DataFrame containing the bars data
+            validated: Skip the column check for frames the caller already validated
+        
+        Raises:
+            StorageError: If required columns are missing
+        """
+        if not validated and not _REQUIRED_COLS.issubset(bars.columns):
+            missing = sorted(_REQUIRED_COLS.difference(bars.columns))
+            raise StorageError(f"DataFrame missing required columns: {missing}")
+        
+        return pa.Table.from_pandas(bars.astype(_DTYPES), preserve_index=False)
     
     def get_existing_dates(self, symbol: str) -> List[date]:
         """
@@ -44,51 +314,194 @@ class StorageHelper:
             List of dates that have been fetched
         """
         symbol_dir = self._get_symbol_dir(symbol)
-        if not symbol_dir.exists():
+        try:
+            mtime_ns = symbol_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
         
-        dates = []
-        for file_path in symbol_dir.glob('*.csv'):
-            try:
-                # Extract date from filename (YYYY-MM-DD.csv)
-                date_str = file_path.stem
-                file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                dates.append(file_date)
-            except ValueError:
-                continue
+        # Adding or removing files changes the directory mtime. Writes made by
+        # this helper also drop the entry directly, see _invalidate_dates_cache.
+        cached = self._dates_cache.get(symbol.upper())
+        if (cached is not None and cached[0] == mtime_ns
+                and mtime_ns + self.MTIME_GRANULARITY_NS <= cached[1]):
+            return list(cached[2])
+        
+        scanned_at_ns = time.time_ns()
+        dates = set()
+        session_days: Dict[date, Tuple[Path, int]] = {}
+        suffixes = (self.FILE_SUFFIX, self.LEGACY_SUFFIX)
+        with os.scandir(symbol_dir) as entries:
+            for entry in entries:
+                # Extract date from filename (YYYY-MM-DD.parquet or YYYY-MM-DD.csv)
+                name = entry.name
+                if name.startswith(self.SESSION_PREFIX) and name.endswith(self.FILE_SUFFIX):
+                    # Session files list their days in the footer, so no data is decoded
+                    path = Path(entry.path)
+                    try:
+                        for day, row_group in _read_session_days(path):
+                            session_days[day] = (path, row_group)
+                    except (OSError, ValueError, pa.ArrowException) as e:
+                        # An unreadable file must not hide the rest of the symbol's days;
+                        # its days are simply fetched again
+                        logging.getLogger(__name__).warning(f"Skipping unreadable session file {path}: {str(e)}")
+                    continue
+                if not name.endswith(suffixes):
+                    continue
+                s = name[:name.rindex('.')]
+                if len(s) != 10 or s[4] != '-' or s[7] != '-':
+                    continue
+                try:
+                    dates.add(date(int(s[:4]), int(s[5:7]), int(s[8:10])))
+                except ValueError:
+                    continue
+        
+        dates.update(session_days)
+        sorted_dates = sorted(dates)
+        self._dates_cache[symbol.upper()] = (mtime_ns, scanned_at_ns, sorted_dates)
+        self._session_days[symbol.upper()] = session_days
+        return list(sorted_dates)
+    
+    def get_existing_dates_bulk(self, symbols: List[str], max_workers: int = 16) -> Dict[str, List[date]]:
+        """
+        Get the fetched dates for many symbols, scanning their directories in parallel.
+        
+        Args:
+            symbols: The symbols to check
+            max_workers: Maximum number of scanning threads
+        
+        Returns:
+            Dictionary mapping each symbol to its list of fetched dates
+        """
+        if not symbols:
+            return {}
         
-        return sorted(dates)
+        # Directory scans spend most of their time in syscalls, which release the GIL
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            return dict(zip(symbols, executor.map(self.get_existing_dates, symbols)))
     
-    def save_bars(self, symbol: str, date: date, bars: pd.DataFrame) -> None:
+    def remove_stale_tmp_files(self, symbol: str) -> int:
         """
-        Save bars data to CSV file.
+        Remove temporary files that a crashed writer left in a symbol's directory.
+        
+        Only files older than STALE_TMP_SECONDS are removed, so writes that are
+        still in progress in another process are left alone.
+        
+        Args:
+            symbol: The symbol
+        
+        Returns:
+            Number of files removed
+        """
+        cutoff = time.time() - self.STALE_TMP_SECONDS
+        removed = 0
+        try:
+            with os.scandir(self._get_symbol_dir(symbol)) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith('.') and name.endswith(self.TMP_SUFFIX)):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            return 0
+        return removed
+    
+    def _invalidate_dates_cache(self, symbol: str) -> None:
+        """Drop the cached dates of a symbol after writing to its directory."""
+        self._dates_cache.pop(symbol.upper(), None)
+    
+    def open_symbol_writer(self, symbol: str) -> SymbolWriter:
+        """
+        Open a writer that stores a batch of a symbol's days in one session file, one row group per day.
+        
+        Args:
+            symbol: The symbol
+        
+        Returns:
+            A SymbolWriter, to be used as a context manager
+        
+        Raises:
+            StorageError: If the symbol directory cannot be created
+        """
+        try:
+            self._ensure_symbol_dir(symbol)
+        except Exception as e:
+            raise StorageError(f"Failed to open writer for {symbol}: {str(e)}")
+        return SymbolWriter(self, symbol)
+    
+    def _session_candidates(self, symbol: str, date: date,
+                            refresh: bool = True) -> Iterator[Tuple[Path, Callable[[Path], pa.Table]]]:
+        """Yield the session file location of a day, if one holds it, rescanning the directory if refresh is set."""
+        if refresh:
+            self.get_existing_dates(symbol)
+        location = self._session_days.get(symbol.upper(), {}).get(date)
+        if location is not None:
+            path, row_group = location
+            yield path, functools.partial(_read_row_groups, row_groups=[row_group])
+    
+    def save_bars(self, symbol: str, date: date, bars: 'pd.DataFrame', validated: bool = False) -> None:
+        """
+        Save bars data to a Parquet file.
         
         Args:
             symbol: The symbol
             date: The date of the bars
             bars: DataFrame containing the bars data
+            validated: True if the caller already validated the bars
         
         Raises:
             StorageError: If saving fails
         """
         try:
             self._ensure_symbol_dir(symbol)
-            file_path = self._get_symbol_dir(symbol) / f"{date.strftime('%Y-%m-%d')}.csv"
-            
-            # Ensure DataFrame has correct columns
-            required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            if not all(col in bars.columns for col in required_columns):
-                raise StorageError(f"DataFrame missing required columns: {required_columns}")
+            file_path = self._get_file_path(symbol, date)
+            tmp_path = file_path.with_name(f".{file_path.name}{self.TMP_SUFFIX}")
             
-            # Save to CSV
-            bars.to_csv(file_path, index=False)
+            # Save to Parquet, converting straight to an Arrow table. The file is written
+            # under a temporary name so a failed write never leaves a truncated day behind.
+            table = self._to_table(bars, validated)
+            try:
+                with open(tmp_path, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                    pq.write_table(table, f, compression='snappy')
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            self._invalidate_dates_cache(symbol)
             
         except Exception as e:
             raise StorageError(f"Failed to save bars for {symbol} on {date}: {str(e)}")
     
-    def read_bars(self, symbol: str, date: date) -> Optional[pd.DataFrame]:
+    def save_bars_bulk(self, symbol: str, data: Dict[date, 'pd.DataFrame'], validated: bool = False) -> None:
         """
-        Read bars data from CSV file.
+        Save bars for several days to one session file, one row group per day.
+        
+        The days are on disk once this returns; if it raises, none of them are.
+        
+        Args:
+            symbol: The symbol
+            data: Dictionary mapping each date to a DataFrame containing its bars
+            validated: True if the caller already validated the bars
+        
+        Raises:
+            StorageError: If saving fails
+        """
+        if not data:
+            return
+        
+        with self.open_symbol_writer(symbol) as writer:
+            for day, bars in data.items():
+                writer.add_day(day, bars, validated)
+    
+    def read_bars(self, symbol: str, date: date) -> Optional['pd.DataFrame']:
+        """
+        Read bars data from a Parquet file or session file row group, falling back to a legacy CSV file.
         
         Args:
             symbol: The symbol
@@ -97,16 +510,94 @@ class StorageHelper:
         Returns:
             DataFrame containing the bars data, or None if file doesn't exist
         """
-        file_path = self._get_symbol_dir(symbol) / f"{date.strftime('%Y-%m-%d')}.csv"
-        if not file_path.exists():
+        # Files are memory-mapped so the page cache serves reads without an extra copy
+        candidates = ((self._get_file_path(symbol, date), _read_parquet_mapped),)
+        legacy = ((self._get_file_path(symbol, date, self.LEGACY_SUFFIX), _read_csv_mapped),)
+        
+        # Open each location directly rather than checking for it first. A day
+        # already known to be in a session file is read without touching the
+        # directory; the directory is only rescanned once the per-day file misses.
+        for path, read_table in chain(self._session_candidates(symbol, date, refresh=False), candidates,
+                                      self._session_candidates(symbol, date), legacy):
+            try:
+                return read_table(path).to_pandas(self_destruct=True)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                raise StorageError(f"Failed to read bars for {symbol} on {date}: {str(e)}")
+        
+        return None
+    
+    def read_bars_range(self, symbol: str, start_date: date, end_date: date) -> Optional['pd.DataFrame']:
+        """
+        Read bars for all fetched days in a date range with a single dataset scan.
+        
+        Args:
+            symbol: The symbol
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+        
+        Returns:
+            DataFrame containing the bars in date order, or None if no day in the range was fetched
+        """
+        dates = [d for d in self.get_existing_dates(symbol) if start_date <= d <= end_date]
+        if not dates:
             return None
         
+        import pandas as pd
+        
         try:
-            return pd.read_csv(file_path)
+            # Days in session files come straight from the map built by the scan above,
+            # with each file's row groups read in one call. The remaining days are
+            # per-day Parquet files, scanned together without checking for them first.
+            session_row_groups: Dict[Path, List[int]] = {}
+            session_days = self._session_days.get(symbol.upper(), {})
+            other_days: List[date] = []
+            frames: List[pd.DataFrame] = []
+            for day in dates:
+                location = session_days.get(day)
+                if location is not None:
+                    path, row_group = location
+                    session_row_groups.setdefault(path, []).append(row_group)
+                else:
+                    other_days.append(day)
+            
+            for path, row_groups in session_row_groups.items():
+                frames.append(_read_row_groups(path, row_groups).to_pandas(self_destruct=True))
+            
+            if other_days:
+                import pyarrow.dataset as pads
+                import pyarrow.fs as pafs
+                
+                paths = [str(self._get_file_path(symbol, day)) for day in other_days]
+                try:
+                    dataset = pads.dataset(
+                        paths, format='parquet', filesystem=pafs.LocalFileSystem(use_mmap=True)
+                    )
+                    frames.append(dataset.to_table().to_pandas(self_destruct=True))
+                except FileNotFoundError:
+                    # Some day exists only as legacy CSV; read the remaining days one by one
+                    for day in other_days:
+                        frame = self.read_bars(symbol, day)
+                        if frame is not None:
+                            frames.append(frame)
+            
+            if not frames:
+                return None
+            
+            if len(frames) > 1:
+                # Legacy CSV timestamps come back in UTC; align timezones before concatenating
+                if len({str(frame['timestamp'].dtype) for frame in frames}) > 1:
+                    frames = [frame.assign(timestamp=pd.to_datetime(frame['timestamp'], utc=True))
+                              for frame in frames]
+                bars = pd.concat(frames, ignore_index=True)
+            else:
+                bars = frames[0]
+            return bars.sort_values('timestamp', ignore_index=True)
         except Exception as e:
-            raise StorageError(f"Failed to read bars for {symbol} on {date}: {str(e)}")
+            raise StorageError(f"Failed to read bars for {symbol} on {start_date} to {end_date}: {str(e)}")
     
-    def validate_bars(self, bars: pd.DataFrame, expected_rows: int = 390) -> bool:
+    def validate_bars(self, bars: 'pd.DataFrame', expected_rows: int = 390) -> bool:
         """
         Validate bars data.
         
@@ -120,21 +611,40 @@ class StorageHelper:
         if bars is None or len(bars) != expected_rows:
             return False
         
-        required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        if not all(col in bars.columns for col in required_columns):
+        if not _REQUIRED_COLS.issubset(bars.columns):
             return False
         
-        # Check for missing values
-        if bars[required_columns].isnull().any().any():
+        # Check for missing or out-of-order timestamps
+        if not _validate_timestamps(bars['timestamp']):
             return False
         
-        # Check for negative values in OHLCV
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        if (bars[numeric_columns] < 0).any().any():
+        # Run the OHLCV checks on one contiguous float64 block
+        numeric = np.ascontiguousarray(bars[list(_NUMERIC_COLS)].to_numpy(dtype=np.float64))
+        
+        # Check for missing, infinite, negative and fractional values and the high/low relationship
+        return bool(_validate_block(numeric))
+    
+    def validate_arrays(self, timestamps: Sequence, ohlcv: np.ndarray, expected_rows: int = 390) -> bool:
+        """
+        Validate bars as timestamps and a numpy OHLCV block, before building a DataFrame.
+        
+        Applies the same checks as validate_bars.
+        
+        Args:
+            timestamps: Bar timestamps
+            ohlcv: C-contiguous float64 array of shape (rows, 5) holding open, high,
+                low, close and volume, so missing and fractional volumes can be detected
+            expected_rows: Expected number of rows (default: 390 for 1-min bars)
+        
+        Returns:
+            True if validation passes, False otherwise
+        """
+        if len(timestamps) != expected_rows or ohlcv.shape != (expected_rows, len(_NUMERIC_COLS)):
             return False
         
-        # Check high/low relationship
-        if not (bars['high'] >= bars['low']).all():
+        # Check for missing or out-of-order timestamps
+        if not _validate_timestamps(timestamps):
             return False
         
-        return True 
\ No newline at end of file
+        # Check for missing, infinite, negative and fractional values and the high/low relationship
+        return bool(_validate_block(ohlcv))
\ No newline at end of file